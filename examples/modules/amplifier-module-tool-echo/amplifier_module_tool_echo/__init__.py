@@ -5,8 +5,10 @@ Used to demonstrate local module development and testing with Amplifier Playgrou
 """
 
 import logging
+import time
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from amplifier_core import ModuleCoordinator, ToolResult
 
@@ -14,6 +16,14 @@ __all__ = ["EchoTool", "TimeTool", "mount"]
 
 logger = logging.getLogger(__name__)
 
+# Output formatters for TimeTool, keyed by the "format" input value.
+# "unix" reads the clock directly instead of building a datetime.
+_TIME_FORMATTERS: dict[str, Callable[[], str]] = {
+    "iso": lambda: datetime.now().isoformat(),
+    "human": lambda: datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+    "unix": lambda: str(int(time.time())),
+}
+
 
 class EchoTool:
     """Echo back messages with optional transformation."""
@@ -26,50 +36,49 @@ This is a simple example tool for testing Amplifier module development.
 It can echo messages as-is, uppercase, lowercase, or reversed.
 """
 
+    # JSON schema for tool parameters, shared by all instances
+    input_schema: ClassVar[dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "The message to echo back",
+            },
+            "transform": {
+                "type": "string",
+                "enum": ["none", "upper", "lower", "reverse"],
+                "description": "Optional transformation to apply",
+                "default": "none",
+            },
+        },
+        "required": ["message"],
+    }
+
+    # Supported transformations, keyed by the "transform" input value
+    _TRANSFORMS: ClassVar[dict[str, Callable[[str], str]]] = {
+        "none": str,
+        "upper": str.upper,
+        "lower": str.lower,
+        "reverse": lambda s: s[::-1],
+    }
+
+    __slots__ = ("config", "coordinator", "prefix")
+
     def __init__(self, config: dict[str, Any], coordinator: ModuleCoordinator):
         """Initialize EchoTool."""
         self.config = config
         self.coordinator = coordinator
         self.prefix = config.get("prefix", "")
 
-    @property
-    def input_schema(self) -> dict:
-        """Return JSON schema for tool parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "The message to echo back",
-                },
-                "transform": {
-                    "type": "string",
-                    "enum": ["none", "upper", "lower", "reverse"],
-                    "description": "Optional transformation to apply",
-                    "default": "none",
-                },
-            },
-            "required": ["message"],
-        }
-
     async def execute(self, input: dict[str, Any]) -> ToolResult:
         """Execute the echo tool."""
         message = input.get("message", "")
         transform = input.get("transform", "none")
 
-        result = message
+        result = self._TRANSFORMS.get(transform, str)(message)
 
-        if transform == "upper":
-            result = message.upper()
-        elif transform == "lower":
-            result = message.lower()
-        elif transform == "reverse":
-            result = message[::-1]
-
-        if self.prefix:
-            result = f"{self.prefix}{result}"
-
-        return ToolResult(output=result)
+        # An empty prefix leaves the result unchanged, so no branch is needed
+        return ToolResult(output=f"{self.prefix}{result}")
 
 
 class TimeTool:
@@ -83,42 +92,32 @@ Returns the current timestamp in ISO format.
 Useful for testing and demonstrating tool functionality.
 """
 
+    # JSON schema for tool parameters, shared by all instances
+    input_schema: ClassVar[dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "format": {
+                "type": "string",
+                "enum": ["iso", "human", "unix"],
+                "description": "Output format for the time",
+                "default": "iso",
+            },
+        },
+    }
+
+    __slots__ = ("config", "coordinator", "timezone")
+
     def __init__(self, config: dict[str, Any], coordinator: ModuleCoordinator):
         """Initialize TimeTool."""
         self.config = config
         self.coordinator = coordinator
         self.timezone = config.get("timezone", "UTC")
 
-    @property
-    def input_schema(self) -> dict:
-        """Return JSON schema for tool parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "format": {
-                    "type": "string",
-                    "enum": ["iso", "human", "unix"],
-                    "description": "Output format for the time",
-                    "default": "iso",
-                },
-            },
-        }
-
     async def execute(self, input: dict[str, Any]) -> ToolResult:
         """Execute the time tool."""
         format_type = input.get("format", "iso")
-        now = datetime.now()
-
-        if format_type == "iso":
-            result = now.isoformat()
-        elif format_type == "human":
-            result = now.strftime("%B %d, %Y at %I:%M %p")
-        elif format_type == "unix":
-            result = str(int(now.timestamp()))
-        else:
-            result = now.isoformat()
-
-        return ToolResult(output=result)
+        formatter = _TIME_FORMATTERS.get(format_type, _TIME_FORMATTERS["iso"])
+        return ToolResult(output=formatter())
 
 
 async def mount(coordinator: ModuleCoordinator, config: dict[str, Any] | None = None) -> None:
@@ -1,41 +1,57 @@
 """Main CLI entry point for Amplifier Playground."""
 
-import asyncio
-import json
+import functools
+import itertools
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from amplifier_playground.core import (
-    CollectionManager,
-    ModuleRegistry,
-    SessionRunner,
-    create_cli_event_callback,
-)
-from amplifier_playground.core.mention_loader import MentionLoader, MentionResolver
-from amplifier_profiles import (
-    ProfileLoader,
-    ProfileError,
-    compile_profile_to_mount_plan,
-    AgentLoader,
-    AgentResolver,
-)
+from amplifier_playground.core import json_utils
+
+# Heavy imports (amplifier-core, amplifier-profiles, uvicorn, and asyncio/threading
+# for the session and listing commands) are deferred to the command bodies that
+# need them, so `amplay --help` and light subcommands stay fast.
+if TYPE_CHECKING:
+    from amplifier_profiles import AgentLoader
+
+    from amplifier_playground.core import CollectionManager, ModuleRegistry, MountPlanCache
+
+
+@functools.cache
+def _project_amplifier_dir() -> Path:
+    """Project-local .amplifier directory (cwd is read once per process)."""
+    return Path.cwd() / ".amplifier"
+
+
+@functools.cache
+def _user_amplifier_dir() -> Path:
+    """User-global ~/.amplifier directory (home is read once per process)."""
+    return Path.home() / ".amplifier"
 
 
 class CollectionResolverAdapter:
     """Adapter to make CollectionManager work with ProfileLoader and AgentResolver."""
 
-    def __init__(self, collection_manager: CollectionManager):
+    def __init__(self, collection_manager: "CollectionManager"):
         self._manager = collection_manager
+        self._cache: dict[str, Path | None] = {}
 
     def resolve(self, collection_name: str) -> Path | None:
-        """Resolve collection name to filesystem path."""
-        return self._manager.resolve_collection(collection_name)
+        """Resolve collection name to filesystem path.
+
+        Results (including misses) are memoized, so each collection is resolved
+        at most once per adapter no matter how many loaders ask for it.
+        """
+        if collection_name not in self._cache:
+            self._cache[collection_name] = self._manager.resolve_collection(collection_name)
+        return self._cache[collection_name]
 
 
-def build_agent_loader(collection_manager: CollectionManager) -> AgentLoader:
+def build_agent_loader(collection_manager: "CollectionManager") -> "AgentLoader":
     """
     Build an AgentLoader with search paths from collections and local directories.
 
@@ -44,27 +60,26 @@ def build_agent_loader(collection_manager: CollectionManager) -> AgentLoader:
     2. User-global: ~/.amplifier/agents/
     3. Collection agents directories
     """
-    search_paths: list[Path] = []
+    from amplifier_profiles import AgentLoader, AgentResolver
+
+    from amplifier_playground.core.mention_loader import MentionLoader, MentionResolver
+
     resolver_adapter = CollectionResolverAdapter(collection_manager)
 
     # Local agents directories (will be searched in reverse order = highest priority)
-    local_agents = Path.cwd() / ".amplifier" / "agents"
-    if local_agents.exists():
-        search_paths.append(local_agents)
-
-    user_agents = Path.home() / ".amplifier" / "agents"
-    if user_agents.exists():
-        search_paths.append(user_agents)
+    local_agents = _project_amplifier_dir() / "agents"
+    user_agents = _user_amplifier_dir() / "agents"
 
     # Collection agents directories
     # The resolver returns the package dir, agents are at parent/agents
-    for coll in collection_manager.list_collections():
-        coll_path = collection_manager.resolve_collection(coll.name)
-        if coll_path:
-            # Hybrid packaging: agents are at collection root, not in package
-            agents_path = coll_path.parent / "agents"
-            if agents_path.exists():
-                search_paths.append(agents_path)
+    # (hybrid packaging: agents are at collection root, not in package)
+    coll_paths = (resolver_adapter.resolve(name) for name in collection_manager.iter_collection_names())
+    collection_agents = (coll_path.parent / "agents" for coll_path in coll_paths if coll_path)
+
+    # Single pass over all candidates, keeping only existing directories
+    search_paths = [
+        path for path in itertools.chain((local_agents, user_agents), collection_agents) if os.path.isdir(path)
+    ]
 
     # Create resolver and loader
     agent_resolver = AgentResolver(
@@ -79,10 +94,178 @@ def build_agent_loader(collection_manager: CollectionManager) -> AgentLoader:
     return AgentLoader(resolver=agent_resolver, mention_loader=mention_loader)
 
 
+def compile_profile(
+    profile: str,
+    collection_manager: "CollectionManager",
+    plan_cache: "MountPlanCache | None" = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Load a profile with inheritance resolution and compile it to a mount plan.
+
+    With a plan_cache, results persist across processes, keyed by a
+    fingerprint of the collection search paths and the local .amplifier
+    profile/agent/context directories, so compiling an unchanged profile
+    skips inheritance and agent resolution. Files reached only through
+    @mentions outside those directories (cwd-relative paths, @~/...) are not
+    part of the key, which is why callers opt in to the cache.
+
+    Args:
+        profile: Profile reference (collection:profile or local profile name)
+        collection_manager: Collection manager used to resolve collections
+        plan_cache: Optional on-disk cache consulted before compiling
+
+    Returns:
+        Tuple of (profile display name, mount plan). The mount plan is fresh
+        and the caller may mutate it.
+
+    Raises:
+        ProfileError: If the profile cannot be found or loaded
+    """
+    from amplifier_playground.core.mount_plan_cache import fingerprint
+
+    if plan_cache is not None:
+        # Collections plus the local profile, agent and @mention context dirs
+        source_dirs = [
+            *collection_manager.search_paths,
+            *(
+                base / sub
+                for base in (_project_amplifier_dir(), _user_amplifier_dir())
+                for sub in ("profiles", "agents", "context")
+            ),
+        ]
+        disk_key = fingerprint(profile, source_dirs)
+        hit = plan_cache.get(disk_key)
+        if hit is not None:
+            return hit
+
+    from amplifier_profiles import ProfileLoader, compile_profile_to_mount_plan
+
+    resolver = CollectionResolverAdapter(collection_manager)
+
+    # Build search paths for local profiles
+    local_search_paths: list[Path] = []
+    local_profiles = _project_amplifier_dir() / "profiles"
+    if local_profiles.exists():
+        local_search_paths.append(local_profiles)
+    user_profiles = _user_amplifier_dir() / "profiles"
+    if user_profiles.exists():
+        local_search_paths.append(user_profiles)
+
+    loader = ProfileLoader(
+        search_paths=local_search_paths,
+        collection_resolver=resolver,
+    )
+
+    # Load profile with inheritance resolution
+    loaded_profile = loader.load_profile(profile)
+
+    # Build agent loader for agents: all resolution
+    agent_loader = build_agent_loader(collection_manager)
+
+    # Compile to mount plan
+    mount_plan = compile_profile_to_mount_plan(loaded_profile, agent_loader=agent_loader)
+    profile_name = loaded_profile.profile.name
+
+    if plan_cache is not None:
+        plan_cache.put(disk_key, profile_name, mount_plan)
+    return profile_name, mount_plan
+
+
+class _CliState:
+    """Per-invocation shared objects, built on first use.
+
+    Stored as the root context's obj so commands reuse one registry and one
+    collection manager (and their discovery caches) instead of each
+    constructing their own.
+    """
+
+    @functools.cached_property
+    def registry(self) -> "ModuleRegistry":
+        from amplifier_playground.core import ModuleRegistry
+
+        return ModuleRegistry()
+
+    @functools.cached_property
+    def collections(self) -> "CollectionManager":
+        from amplifier_playground.core import CollectionManager
+
+        return CollectionManager()
+
+
+pass_state = click.make_pass_decorator(_CliState, ensure=True)
+
+
+def _echo_json(obj: Any) -> None:
+    """Write obj to stdout as indented JSON for --json output.
+
+    Encoded bytes go straight to the binary stream, skipping click.echo's
+    text handling, which machine-readable output does not need.
+    """
+    sys.stdout.flush()  # keep ordering with any text already echoed
+    stdout = sys.stdout.buffer
+    stdout.write(json_utils.dumps_bytes(obj, indent=True) + b"\n")
+    stdout.flush()
+
+
+def _echo_json_array(items: Iterable[Any]) -> None:
+    """Stream items to stdout as an indented JSON array for --json output.
+
+    Each element is written as it is produced, in the same layout as
+    _echo_json(list(items)), so large listings need not be held in memory.
+    """
+    sys.stdout.flush()  # keep ordering with any text already echoed
+    stdout = sys.stdout.buffer
+    separator = b"[\n"
+    for item in items:
+        encoded = json_utils.dumps_bytes(item, indent=True).replace(b"\n", b"\n  ")
+        stdout.write(separator + b"  " + encoded)
+        separator = b",\n"
+    stdout.write(b"[]\n" if separator == b"[\n" else b"\n]\n")
+    stdout.flush()
+
+
 # Helper to run async functions from sync Click commands
 def run_async(coro):
     """Run async coroutine from sync context."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    import asyncio
+
+    return asyncio.run(coro)
+
+
+async def prompt_async(text: str) -> str:
+    """Read a line with click.prompt without blocking the event loop.
+
+    The read runs on a daemon thread, so session events keep streaming while
+    waiting for input, and a pending read never holds up interpreter exit
+    (unlike the default executor, which joins its threads on shutdown).
+
+    Raises:
+        click.Abort: On EOF or interrupt at the prompt
+    """
+    import asyncio
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def resolve(result: str | None, error: BaseException | None) -> None:
+        if future.done():  # cancelled while the user was typing
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)  # type: ignore[arg-type]
+
+    def read() -> None:
+        try:
+            result = click.prompt(text, prompt_suffix="")
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, result, None)
+
+    threading.Thread(target=read, name="amplay-prompt", daemon=True).start()
+    return await future
 
 
 @click.group(invoke_without_command=True)
@@ -93,6 +276,8 @@ def cli(ctx):
 
     Run without arguments to launch the web UI.
     """
+    # Cheap: the registry and collection manager are only built when accessed
+    ctx.ensure_object(_CliState)
     if ctx.invoked_subcommand is None:
         # Default to web UI when no command given
         ctx.invoke(web)
@@ -109,12 +294,17 @@ def modules():
     pass
 
 
+# Module categories in display order
+_CATEGORY_ORDER = ("orchestrator", "context", "provider", "tool", "hook")
+
+
 @modules.command("list")
 @click.option("--category", "-c", help="Filter by category (orchestrator, context, provider, tool, hook)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def modules_list(category: str | None, as_json: bool):
+@pass_state
+def modules_list(state: _CliState, category: str | None, as_json: bool):
     """List available modules."""
-    registry = ModuleRegistry()
+    registry = state.registry
 
     if category:
         mods = registry.list_by_category(category)
@@ -132,29 +322,35 @@ def modules_list(category: str | None, as_json: bool):
             }
             for m in mods
         ]
-        click.echo(json.dumps(output, indent=2))
+        _echo_json(output)
     else:
         if not mods:
             click.echo("No modules found.")
             return
 
-        # Group by category for display
-        by_category: dict[str, list] = {}
+        # Group by category for display; insertion order is display order, and
+        # any category outside the standard set is appended after them
+        by_category: dict[str, list] = {cat: [] for cat in _CATEGORY_ORDER}
         for m in mods:
             by_category.setdefault(m.category, []).append(m)
 
-        for cat, cat_mods in sorted(by_category.items()):
-            click.echo(f"\n{cat.upper()}:")
+        lines: list[str] = []
+        for cat, cat_mods in by_category.items():
+            if not cat_mods:
+                continue
+            lines.append(f"\n{cat.upper()}:")
             for m in cat_mods:
                 source_tag = f" [{m.source}]" if m.source != "known" else ""
-                click.echo(f"  {m.id}: {m.description or m.name}{source_tag}")
+                lines.append(f"  {m.id}: {m.description or m.name}{source_tag}")
+        click.echo("\n".join(lines))
 
 
 @modules.command("info")
 @click.argument("module_id")
-def modules_info(module_id: str):
+@pass_state
+def modules_info(state: _CliState, module_id: str):
     """Show detailed info about a module."""
-    registry = ModuleRegistry()
+    registry = state.registry
     info = registry.get_info(module_id)
 
     if not info:
@@ -170,18 +366,21 @@ def modules_info(module_id: str):
     if info.version:
         click.echo(f"Version: {info.version}")
     if info.config_schema:
-        click.echo(f"Config Schema: {json.dumps(info.config_schema, indent=2)}")
+        click.echo(f"Config Schema: {json_utils.dumps(info.config_schema, indent=True)}")
 
 
 @modules.command("register")
 @click.argument("module_path", type=click.Path(exists=True))
 @click.option("--id", "module_id", required=True, help="Module identifier")
 @click.option("--name", required=True, help="Display name")
-@click.option("--category", required=True, type=click.Choice(["orchestrator", "context", "provider", "tool", "hook"]))
+@click.option("--category", required=True, type=click.Choice(_CATEGORY_ORDER))
 @click.option("--description", help="Module description")
-def modules_register(module_path: str, module_id: str, name: str, category: str, description: str | None):
+@pass_state
+def modules_register(
+    state: _CliState, module_path: str, module_id: str, name: str, category: str, description: str | None
+):
     """Register a local development module."""
-    registry = ModuleRegistry()
+    registry = state.registry
     registry.register_local(
         module_id=module_id,
         name=name,
@@ -205,14 +404,15 @@ def collections():
 
 @collections.command("list")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def collections_list(as_json: bool):
+@pass_state
+def collections_list(state: _CliState, as_json: bool):
     """List available collections."""
-    manager = CollectionManager()
+    manager = state.collections
     colls = manager.list_collections()
 
     if as_json:
         output = [{"name": c.name, "path": str(c.path)} for c in colls]
-        click.echo(json.dumps(output, indent=2))
+        _echo_json(output)
     else:
         if not colls:
             click.echo("No collections found.")
@@ -226,12 +426,23 @@ def collections_list(as_json: bool):
             click.echo(f"  {c.name}: {c.path}")
 
 
+# CollectionResources attribute -> display label, in output order
+_RESOURCE_SECTIONS = (
+    ("profiles", "Profiles"),
+    ("agents", "Agents"),
+    ("context", "Context"),
+    ("scenario_tools", "Scenario Tools"),
+    ("modules", "Modules"),
+)
+
+
 @collections.command("show")
 @click.argument("collection_name")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def collections_show(collection_name: str, as_json: bool):
+@pass_state
+def collections_show(state: _CliState, collection_name: str, as_json: bool):
     """Show details about a collection."""
-    manager = CollectionManager()
+    manager = state.collections
     info = manager.get_collection_info(collection_name)
 
     if not info:
@@ -243,55 +454,35 @@ def collections_show(collection_name: str, as_json: bool):
             "name": info.name,
             "path": str(info.path),
             "resources": {
-                "profiles": [str(p) for p in (info.resources.profiles if info.resources else [])],
-                "agents": [str(p) for p in (info.resources.agents if info.resources else [])],
-                "context": [str(p) for p in (info.resources.context if info.resources else [])],
-                "scenario_tools": [str(p) for p in (info.resources.scenario_tools if info.resources else [])],
-                "modules": [str(p) for p in (info.resources.modules if info.resources else [])],
+                key: [str(p) for p in (getattr(info.resources, key) if info.resources else [])]
+                for key, _label in _RESOURCE_SECTIONS
             },
         }
-        click.echo(json.dumps(output, indent=2))
+        _echo_json(output)
     else:
-        click.echo(f"Collection: {info.name}")
-        click.echo(f"Path: {info.path}")
+        lines = [f"Collection: {info.name}", f"Path: {info.path}"]
 
         if info.resources:
-            if info.resources.profiles:
-                click.echo(f"\nProfiles ({len(info.resources.profiles)}):")
-                for p in info.resources.profiles:
-                    click.echo(f"  {p.name}")
-
-            if info.resources.agents:
-                click.echo(f"\nAgents ({len(info.resources.agents)}):")
-                for a in info.resources.agents:
-                    click.echo(f"  {a.name}")
-
-            if info.resources.context:
-                click.echo(f"\nContext ({len(info.resources.context)}):")
-                for c in info.resources.context:
-                    click.echo(f"  {c.name}")
+            for key, label in _RESOURCE_SECTIONS:
+                items = getattr(info.resources, key)
+                if items:
+                    lines.append(f"\n{label} ({len(items)}):")
+                    lines.extend(f"  {item.name}" for item in items)
 
-            if info.resources.scenario_tools:
-                click.echo(f"\nScenario Tools ({len(info.resources.scenario_tools)}):")
-                for s in info.resources.scenario_tools:
-                    click.echo(f"  {s.name}")
-
-            if info.resources.modules:
-                click.echo(f"\nModules ({len(info.resources.modules)}):")
-                for m in info.resources.modules:
-                    click.echo(f"  {m.name}")
+        click.echo("\n".join(lines))
 
 
 @collections.command("profiles")
 @click.argument("collection_name")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def collections_profiles(collection_name: str, as_json: bool):
+@pass_state
+def collections_profiles(state: _CliState, collection_name: str, as_json: bool):
     """List profiles in a collection."""
-    manager = CollectionManager()
+    manager = state.collections
     profiles = manager.list_profiles_in_collection(collection_name)
 
     if as_json:
-        click.echo(json.dumps([str(p) for p in profiles], indent=2))
+        _echo_json([str(p) for p in profiles])
     else:
         if not profiles:
             click.echo(f"No profiles found in collection: {collection_name}")
@@ -315,62 +506,71 @@ def profiles():
 
 @profiles.command("list")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def profiles_list(as_json: bool):
+@pass_state
+def profiles_list(state: _CliState, as_json: bool):
     """List all available profiles from collections and local directories."""
-    manager = CollectionManager()
-
-    all_profiles: list[dict[str, Any]] = []
-
-    # Get profiles from each collection
-    for coll in manager.list_collections():
-        coll_profiles = manager.list_profiles_in_collection(coll.name)
-        for p in coll_profiles:
-            all_profiles.append({
-                "name": f"{coll.name}:{p.stem}",
-                "collection": coll.name,
-                "profile": p.stem,
-                "path": str(p),
-            })
-
-    # Get local profiles
-    local_paths = [
-        Path.cwd() / ".amplifier" / "profiles",
-        Path.home() / ".amplifier" / "profiles",
-    ]
+    profiles = _iter_profiles(state.collections)
 
-    for local_path in local_paths:
-        if local_path.exists():
-            for p in local_path.glob("*.md"):
-                all_profiles.append({
-                    "name": p.stem,
-                    "collection": None,
+    if as_json:
+        _echo_json_array(profiles)
+        return
+
+    # Profiles arrive grouped (collections by name, then local), so each group
+    # is written as soon as the next one starts
+    found = False
+    for coll, group in itertools.groupby(profiles, key=lambda p: p["collection"]):
+        found = True
+        if coll:
+            lines = [f"\n{coll}:"]
+            lines.extend(f"  {p['profile']:<20} → amplay session run {p['name']}" for p in group)
+        else:
+            lines = ["\nLocal profiles:"]
+            lines.extend(f"  {p['profile']:<20} → amplay session run {p['profile']}" for p in group)
+        click.echo("\n".join(lines))
+
+    if not found:
+        click.echo("No profiles found.")
+
+
+def _iter_profiles(manager: "CollectionManager") -> Iterator[dict[str, Any]]:
+    """Yield profile entries, collection profiles by collection name, then local ones."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Resource discovery is directory scanning, so run the collections
+    # concurrently to overlap the IO; map() still yields in name order
+    coll_names = sorted(manager.iter_collection_names())
+    with ThreadPoolExecutor(max_workers=min(32, len(coll_names) or 1)) as executor:
+        for coll_name, profiles in zip(coll_names, executor.map(manager.list_profiles_in_collection, coll_names)):
+            for p in profiles:
+                yield {
+                    "name": f"{coll_name}:{p.stem}",
+                    "collection": coll_name,
                     "profile": p.stem,
                     "path": str(p),
-                })
-
-    if as_json:
-        click.echo(json.dumps(all_profiles, indent=2))
-    else:
-        if not all_profiles:
-            click.echo("No profiles found.")
-            return
+                }
 
-        # Group by collection
-        by_collection: dict[str | None, list] = {}
-        for p in all_profiles:
-            coll = p["collection"]
-            by_collection.setdefault(coll, []).append(p)
+    # Local profiles
+    local_paths = [
+        _project_amplifier_dir() / "profiles",
+        _user_amplifier_dir() / "profiles",
+    ]
 
-        # Show collection profiles
-        for coll, profs in sorted(by_collection.items(), key=lambda x: (x[0] is None, x[0] or "")):
-            if coll:
-                click.echo(f"\n{coll}:")
-                for p in profs:
-                    click.echo(f"  {p['profile']:<20} → amplay session run {p['name']}")
-            else:
-                click.echo("\nLocal profiles:")
-                for p in profs:
-                    click.echo(f"  {p['profile']:<20} → amplay session run {p['profile']}")
+    for local_path in local_paths:
+        try:
+            entries = os.scandir(local_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                stem = entry.name[: -len(".md")]
+                yield {
+                    "name": stem,
+                    "collection": None,
+                    "profile": stem,
+                    "path": entry.path,
+                }
 
 
 # =============================================================================
@@ -397,13 +597,25 @@ def session():
     multiple=True,
     help="Directory containing amplifier modules. Can be specified multiple times.",
 )
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help=(
+        "Reuse a previously compiled mount plan while collections and local .amplifier profiles/agents/context "
+        "are unchanged. Edits to @mentioned files elsewhere are not detected."
+    ),
+)
+@pass_state
 def session_run(
+    state: _CliState,
     profile: str,
     prompt: str | None,
     interactive: bool,
     events: bool,
     approval: str,
     modules_dir: tuple[str, ...],
+    use_cache: bool,
 ):
     """Run a session from a profile.
 
@@ -416,35 +628,17 @@ def session_run(
         amplay session run developer-expertise:dev --interactive
         amplay session run my-local-profile -p "Hello world"
     """
-    # Compile profile to mount plan
-    try:
-        coll_manager = CollectionManager()
-        resolver = CollectionResolverAdapter(coll_manager)
-
-        # Build search paths for local profiles
-        local_search_paths: list[Path] = []
-        local_profiles = Path.cwd() / ".amplifier" / "profiles"
-        if local_profiles.exists():
-            local_search_paths.append(local_profiles)
-        user_profiles = Path.home() / ".amplifier" / "profiles"
-        if user_profiles.exists():
-            local_search_paths.append(user_profiles)
+    from amplifier_profiles import ProfileError
 
-        loader = ProfileLoader(
-            search_paths=local_search_paths,
-            collection_resolver=resolver,
-        )
+    from amplifier_playground.core import MountPlanCache, SessionRunner, create_cli_event_callback
 
-        # Load profile with inheritance resolution
-        loaded_profile = loader.load_profile(profile)
-
-        # Build agent loader for agents: all resolution
-        agent_loader = build_agent_loader(coll_manager)
-
-        # Compile to mount plan
-        mount_plan = compile_profile_to_mount_plan(loaded_profile, agent_loader=agent_loader)
+    # Compile profile to mount plan
+    try:
+        coll_manager = state.collections
+        plan_cache = MountPlanCache() if use_cache else None
+        profile_display_name, mount_plan = compile_profile(profile, coll_manager, plan_cache)
 
-        click.echo(f"Using profile: {loaded_profile.profile.name}", err=True)
+        click.echo(f"Using profile: {profile_display_name}", err=True)
 
     except ProfileError as e:
         click.echo(f"Failed to load profile '{profile}': {e}", err=True)
@@ -462,6 +656,7 @@ def session_run(
             approval_mode=approval,  # type: ignore
             modules_dirs=list(modules_dir) if modules_dir else None,
             profile_name=profile,
+            collection_manager=coll_manager,
         ) as runner:
             click.echo(f"Session started: {runner.session_id}", err=True)
 
@@ -473,12 +668,12 @@ def session_run(
                 click.echo("Interactive mode. Type 'quit' to exit.", err=True)
                 while True:
                     try:
-                        user_input = click.prompt(">>> ", prompt_suffix="")
+                        user_input = await prompt_async(">>> ")
                         if user_input.lower() in ("quit", "exit", "q"):
                             break
                         response = await runner.prompt(user_input)
                         click.echo(response)
-                    except (KeyboardInterrupt, EOFError):
+                    except (KeyboardInterrupt, EOFError, click.Abort):
                         break
 
             click.echo("Session ended.", err=True)
@@ -499,10 +694,14 @@ def session_run(
 )
 def session_test(mount_plan_file: str, prompt: str, events: bool, modules_dir: tuple[str, ...]):
     """Quick test a mount plan file without saving."""
-    with open(mount_plan_file) as f:
-        mount_plan = json.load(f)
+    import asyncio
+
+    from amplifier_playground.core import SessionRunner, create_cli_event_callback
 
     async def run_test():
+        # Read off the event loop thread; large plans can take a while to load
+        data = await asyncio.to_thread(Path(mount_plan_file).read_bytes)
+        mount_plan = json_utils.loads(data)
         event_callback = create_cli_event_callback() if events else None
 
         async with SessionRunner(
@@ -538,10 +737,11 @@ def web(port: int, host: str, no_open: bool):
         amplay web          # Same as above
         amplay web --no-open --port 8080
     """
-    import uvicorn
     import webbrowser
     from threading import Timer
 
+    import uvicorn
+
     url = f"http://{host}:{port}"
     click.echo(f"🚀 Amplifier Playground → {url}")
     click.echo("Press Ctrl+C to stop\n")
@@ -1,35 +1,87 @@
-"""Core library for Amplifier Playground."""
+"""Core library for Amplifier Playground.
 
-from .collection_manager import CollectionInfo, CollectionManager
-from .config_manager import ConfigManager, MountPlanConfig
-from .credentials import (
-    get_credential,
-    get_credential_status,
-    get_required_credentials_for_providers,
-    load_credentials_to_env,
-    set_credential,
-    delete_credential,
-    get_custom_credentials,
-    add_custom_credential,
-    delete_custom_credential,
-    load_custom_credentials_to_env,
-    ANTHROPIC_API_KEY,
-    OPENAI_API_KEY,
-    AZURE_OPENAI_API_KEY,
-    AZURE_OPENAI_ENDPOINT,
-    OLLAMA_BASE_URL,
-    VLLM_BASE_URL,
-)
-from .module_registry import ModuleInfo, ModuleRegistry
-from .protocols import EventCallback
-from .session_runner import SessionManager, SessionRunner
-from .ux_systems import (
-    PlaygroundApprovalSystem,
-    PlaygroundDisplaySystem,
-    create_cli_event_callback,
-    create_logging_event_callback,
-)
+Public names are resolved lazily on first access (PEP 562), so importing one
+component does not pull in the others and their dependencies.
+"""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .collection_manager import CollectionInfo, CollectionManager
+    from .config_manager import ConfigManager, MountPlanConfig
+    from .credentials import (
+        ANTHROPIC_API_KEY,
+        AZURE_OPENAI_API_KEY,
+        AZURE_OPENAI_ENDPOINT,
+        OLLAMA_BASE_URL,
+        OPENAI_API_KEY,
+        VLLM_BASE_URL,
+        add_custom_credential,
+        delete_credential,
+        delete_custom_credential,
+        get_credential,
+        get_credential_status,
+        get_custom_credentials,
+        get_required_credentials_for_providers,
+        load_credentials_to_env,
+        load_custom_credentials_to_env,
+        set_credential,
+    )
+    from .module_registry import ModuleInfo, ModuleRegistry
+    from .mount_plan_cache import MountPlanCache
+    from .protocols import EventCallback
+    from .session_runner import SessionManager, SessionRunner
+    from .ux_systems import (
+        PlaygroundApprovalSystem,
+        PlaygroundDisplaySystem,
+        create_cli_event_callback,
+        create_logging_event_callback,
+    )
+
+# Public name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    # Collections
+    "CollectionManager": "collection_manager",
+    "CollectionInfo": "collection_manager",
+    # Config
+    "ConfigManager": "config_manager",
+    "MountPlanConfig": "config_manager",
+    # Credentials
+    "get_credential": "credentials",
+    "get_credential_status": "credentials",
+    "get_required_credentials_for_providers": "credentials",
+    "load_credentials_to_env": "credentials",
+    "set_credential": "credentials",
+    "delete_credential": "credentials",
+    "get_custom_credentials": "credentials",
+    "add_custom_credential": "credentials",
+    "delete_custom_credential": "credentials",
+    "load_custom_credentials_to_env": "credentials",
+    "ANTHROPIC_API_KEY": "credentials",
+    "OPENAI_API_KEY": "credentials",
+    "AZURE_OPENAI_API_KEY": "credentials",
+    "AZURE_OPENAI_ENDPOINT": "credentials",
+    "OLLAMA_BASE_URL": "credentials",
+    "VLLM_BASE_URL": "credentials",
+    # Modules
+    "ModuleRegistry": "module_registry",
+    "ModuleInfo": "module_registry",
+    # Mount plan cache
+    "MountPlanCache": "mount_plan_cache",
+    # Sessions
+    "SessionRunner": "session_runner",
+    "SessionManager": "session_runner",
+    # Protocols
+    "EventCallback": "protocols",
+    # UX Systems
+    "PlaygroundApprovalSystem": "ux_systems",
+    "PlaygroundDisplaySystem": "ux_systems",
+    "create_cli_event_callback": "ux_systems",
+    "create_logging_event_callback": "ux_systems",
+}
+
+# Literal so linters and type checkers can see the public names; keep in step with _EXPORTS
 __all__ = [
     # Collections
     "CollectionManager",
@@ -57,6 +109,8 @@ __all__ = [
     # Modules
     "ModuleRegistry",
     "ModuleInfo",
+    # Mount plan cache
+    "MountPlanCache",
     # Sessions
     "SessionRunner",
     "SessionManager",
@@ -68,3 +122,18 @@ __all__ = [
     "create_cli_event_callback",
     "create_logging_event_callback",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining `name` on first access and cache the result."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
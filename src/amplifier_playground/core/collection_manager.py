@@ -4,11 +4,64 @@ Provides collection discovery and resource loading, wrapping amplifier-collectio
 with playground-specific search paths.
 """
 
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from amplifier_collections import CollectionResolver, CollectionResources, discover_collection_resources
-from pydantic import BaseModel, Field
+
+
+def _mtime_ns(path: str | Path) -> int | None:
+    """Modification time of path in nanoseconds, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Resource directories discover_collection_resources() reads. The first group is
+# searched recursively (e.g. context/shared/*.md); the others only list their
+# direct entries (one directory per tool or module), so their top-level mtime
+# is enough and module source trees are never walked.
+_RECURSIVE_RESOURCE_DIRS = ("profiles", "agents", "context")
+_FLAT_RESOURCE_DIRS = ("scenario-tools", "modules")
+
+
+def _tree_stamps(root: str) -> list[tuple[str, int | None]]:
+    """(path, mtime_ns) for root and every directory below it; root alone if missing."""
+    stamps: list[tuple[str, int | None]] = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                stamps.append((path, os.stat(path).st_mtime_ns))
+                stack.extend(entry.path for entry in entries if entry.is_dir())
+        except OSError:
+            stamps.append((path, None))
+    return stamps
+
+
+def _resources_stamp(collection_path: Path) -> tuple:
+    """Change stamp covering every directory collection resources are read from.
+
+    Both the resolved path and its parent are covered: with hybrid packaging
+    the resolver returns the package directory while profiles, agents and
+    context live next to it at the collection root. Adding, removing or
+    renaming a resource file at any depth changes its directory's mtime and
+    therefore the stamp.
+    """
+    stamps: list[tuple[str, int | None]] = []
+    for base in (collection_path, collection_path.parent):
+        stamps.append((str(base), _mtime_ns(base)))
+        for name in _RECURSIVE_RESOURCE_DIRS:
+            stamps.extend(_tree_stamps(os.path.join(base, name)))
+        for name in _FLAT_RESOURCE_DIRS:
+            path = os.path.join(base, name)
+            stamps.append((path, _mtime_ns(path)))
+    return tuple(sorted(stamps))
 
 
 class CollectionResolverAdapter:
@@ -26,7 +79,8 @@ class CollectionResolverAdapter:
         return self.resolve(collection_name)
 
 
-class CollectionInfo(BaseModel):
+@dataclass(slots=True)
+class CollectionInfo:
     """Information about a discovered collection."""
 
     name: str
@@ -55,6 +109,42 @@ class CollectionManager:
         """
         self._search_paths = self._build_search_paths(extra_search_paths or [])
         self._resolver = CollectionResolver(self._search_paths)
+        # Discovery results, filled on demand. Listing and path index are
+        # dropped whenever a search path directory's mtime changes (a
+        # collection was added, removed or renamed), or by refresh().
+        self._search_stamp: tuple[int | None, ...] | None = None
+        # (name, path) pairs from the resolver's listing
+        self._listing: list[tuple[str, Path]] | None = None
+        # Resolved path per collection name (None = collection not found)
+        self._path_index: dict[str, Path | None] = {}
+        # Per collection name: (collection path, directory stamp, resources)
+        self._resources_cache: dict[str, tuple[Path, tuple, CollectionResources]] = {}
+
+    def refresh(self) -> None:
+        """Drop cached discovery results so the next lookup rescans the filesystem.
+
+        Lookups already notice added or removed collections and resources on
+        their own; this forces a full rescan regardless.
+        """
+        self._search_stamp = None
+        self._listing = None
+        self._path_index.clear()
+        self._resources_cache.clear()
+
+    def _check_search_paths(self) -> None:
+        """Drop the listing and path index if any search path directory changed."""
+        stamp = tuple(_mtime_ns(path) for path in self._search_paths)
+        if stamp != self._search_stamp:
+            self._search_stamp = stamp
+            self._listing = None
+            self._path_index.clear()
+
+    def _list_collection_entries(self) -> list[tuple[str, Path]]:
+        """Return the resolver's (name, path) listing, rescanning only after changes."""
+        self._check_search_paths()
+        if self._listing is None:
+            self._listing = list(self._resolver.list_collections())
+        return self._listing
 
     def _build_search_paths(self, extra_paths: list[Path]) -> list[Path]:
         """Build search paths list in precedence order (lowest to highest).
@@ -68,35 +158,24 @@ class CollectionManager:
         4. User-global amplifier: ~/.amplifier/collections/
         5. Bundled collections (package data) - lowest precedence
         """
-        paths: list[Path] = []
-
-        # Lowest: Bundled collections (package data)
         package_dir = Path(__file__).parent.parent  # amplifier_playground/
-        bundled = package_dir / "data" / "collections"
-        if bundled.exists():
-            paths.append(bundled)
-
-        # Low: User-global amplifier collections
-        user_global = Path.home() / ".amplifier" / "collections"
-        if user_global.exists():
-            paths.append(user_global)
-
-        # Middle: User-specific playground collections
-        user_playground = Path.home() / ".amplifier-playground" / "collections"
-        if user_playground.exists():
-            paths.append(user_playground)
-
-        # Higher: Project-local collections
-        project_local = Path.cwd() / ".amplifier" / "collections"
-        if project_local.exists():
-            paths.append(project_local)
-
-        # Highest: Extra paths provided by caller
-        for p in extra_paths:
-            if p.exists():
-                paths.append(p)
-
-        return paths
+        home = Path.home()
+
+        candidates = [
+            # Lowest: Bundled collections (package data)
+            package_dir / "data" / "collections",
+            # Low: User-global amplifier collections
+            home / ".amplifier" / "collections",
+            # Middle: User-specific playground collections
+            home / ".amplifier-playground" / "collections",
+            # Higher: Project-local collections
+            Path.cwd() / ".amplifier" / "collections",
+            # Highest: Extra paths provided by caller
+            *extra_paths,
+        ]
+
+        # One stat per candidate; only directories can hold collections
+        return [p for p in candidates if os.path.isdir(p)]
 
     @property
     def search_paths(self) -> list[Path]:
@@ -110,10 +189,22 @@ class CollectionManager:
             List of CollectionInfo with name and path for each discovered collection.
         """
         collections = []
-        for name, path in self._resolver.list_collections():
+        for name, path in self._list_collection_entries():
             collections.append(CollectionInfo(name=name, path=path))
         return collections
 
+    def iter_collection_names(self) -> Iterator[str]:
+        """Iterate over available collection names.
+
+        Cheaper than list_collections() when only names are needed, since no
+        CollectionInfo objects are built.
+
+        Yields:
+            Name of each discovered collection.
+        """
+        for name, _path in self._list_collection_entries():
+            yield name
+
     def resolve_collection(self, collection_name: str) -> Path | None:
         """Resolve a collection name to its path.
 
@@ -122,8 +213,14 @@ class CollectionManager:
 
         Returns:
             Path to the collection, or None if not found.
+
+        Results are indexed per manager, so repeated lookups are dict hits
+        until a search path directory changes.
         """
-        return self._resolver.resolve(collection_name)
+        self._check_search_paths()
+        if collection_name not in self._path_index:
+            self._path_index[collection_name] = self._resolver.resolve(collection_name)
+        return self._path_index[collection_name]
 
     def get_collection_resources(self, collection_name: str) -> CollectionResources | None:
         """Get all resources in a collection.
@@ -134,12 +231,23 @@ class CollectionManager:
         Returns:
             CollectionResources with profiles, agents, context, scenario_tools, modules.
             None if collection not found.
+
+        Results are cached per manager and reused while none of the
+        directories resources are read from has changed.
         """
-        collection_path = self._resolver.resolve(collection_name)
+        collection_path = self.resolve_collection(collection_name)
         if collection_path is None:
+            self._resources_cache.pop(collection_name, None)
             return None
 
-        return discover_collection_resources(collection_path)
+        stamp = _resources_stamp(collection_path)
+        cached = self._resources_cache.get(collection_name)
+        if cached is not None and cached[0] == collection_path and cached[1] == stamp:
+            return cached[2]
+
+        resources = discover_collection_resources(collection_path)
+        self._resources_cache[collection_name] = (collection_path, stamp, resources)
+        return resources
 
     def get_collection_info(self, collection_name: str) -> CollectionInfo | None:
         """Get full information about a collection including resources.
@@ -150,11 +258,11 @@ class CollectionManager:
         Returns:
             CollectionInfo with resources populated, or None if not found.
         """
-        collection_path = self._resolver.resolve(collection_name)
+        collection_path = self.resolve_collection(collection_name)
         if collection_path is None:
             return None
 
-        resources = discover_collection_resources(collection_path)
+        resources = self.get_collection_resources(collection_name)
         return CollectionInfo(name=collection_name, path=collection_path, resources=resources)
 
     def list_profiles_in_collection(self, collection_name: str) -> list[Path]:
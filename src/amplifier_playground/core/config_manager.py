@@ -1,18 +1,52 @@
 """Configuration manager for mount plan storage."""
 
-import json
+import copy
+import functools
 import logging
+import os
 import re
+import string
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import json_utils
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_DIR = Path.home() / ".amplifier-playground" / "configs"
 
+# Summary index stored next to the configs. The leading dot keeps it clear of
+# config files, whose sanitized IDs never contain one.
+INDEX_FILENAME = ".index.json"
+
+# Listings with at least this many configs load their files on a thread pool
+_PARALLEL_LOAD_MIN = 8
+
+# Characters not allowed in config IDs / filenames, and runs of dashes to collapse
+_UNSAFE_ID_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+_DASH_RUNS = re.compile(r"-+")
+_SAFE_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# ASCII fast path for _generate_id: lowercases and replaces unsafe characters in one pass
+_ID_SAFE_ASCII = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+_ASCII_ID_TABLE = str.maketrans({
+    chr(c): chr(c).lower() if chr(c).lower() in _ID_SAFE_ASCII else "-" for c in range(128)
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _safe_id(config_id: str) -> str:
+    """Sanitize a config ID for use as a filename."""
+    # Generated IDs are already safe; only fall back to the regex when needed
+    if config_id.isascii() and _SAFE_ID_CHARS.issuperset(config_id):
+        return config_id
+    return _UNSAFE_ID_CHARS.sub("_", config_id)
+
 
 @dataclass
 class MountPlanConfig:
@@ -30,17 +64,45 @@ class MountPlanConfig:
         """Convert to dictionary for serialization."""
         return asdict(self)
 
+    def _field_values(self) -> dict[str, Any]:
+        """Field name -> value without copying, for direct serialization.
+
+        Unlike to_dict(), nested values (the mount plan, tags) are shared with
+        this config, so the result must not be mutated.
+        """
+        return {name: getattr(self, name) for name in _CONFIG_FIELDS}
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MountPlanConfig":
         """Create from dictionary."""
         return cls(**data)
 
 
+_CONFIG_FIELDS = tuple(f.name for f in fields(MountPlanConfig))
+
+# Mount plan validation rules: session fields that must be set, and
+# (section, label, at least one entry required) for each module list
+_REQUIRED_SESSION_FIELDS = ("orchestrator", "context")
+_MODULE_SECTIONS = (
+    ("providers", "Provider", True),
+    ("tools", "Tool", False),
+    ("hooks", "Hook", False),
+)
+
+
 class ConfigManager:
     """
     Manages mount plan configurations with file-based JSON storage.
 
     Storage: ~/.amplifier-playground/configs/{config_id}.json
+
+    A summary index (.index.json) holds each config's id, name, updated_at
+    and tags along with the file's mtime/size, plus tag -> config posting
+    lists, so tag filtering only touches the configs it returns. The index
+    is reconciled against the directory on every listing, so files edited
+    or added outside this class are picked up. Parsed configs are kept per
+    manager and reused while a file's mtime/size are unchanged, so each
+    file is parsed once per change rather than once per listing.
     """
 
     def __init__(self, config_dir: Path | None = None):
@@ -52,17 +114,25 @@ class ConfigManager:
         """
         self.config_dir = config_dir or DEFAULT_CONFIG_DIR
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.config_dir / INDEX_FILENAME
+        # Summary rows keyed by config filename, loaded on first use
+        self._index: dict[str, dict[str, Any]] | None = None
+        # Tag -> filenames of configs carrying it, kept in step with _index
+        self._tag_index: dict[str, set[str]] = {}
+        # Filename -> (mtime_ns, size, parsed config) for files seen since startup
+        self._parsed: dict[str, tuple[int, int, MountPlanConfig]] = {}
 
     def _config_path(self, config_id: str) -> Path:
         """Get path for a config file."""
-        # Sanitize ID for filename safety
-        safe_id = re.sub(r"[^a-zA-Z0-9_-]", "_", config_id)
-        return self.config_dir / f"{safe_id}.json"
+        return self.config_dir / f"{_safe_id(config_id)}.json"
 
     def _generate_id(self, name: str) -> str:
         """Generate a unique ID from name."""
-        base_id = re.sub(r"[^a-zA-Z0-9_-]", "-", name.lower())
-        base_id = re.sub(r"-+", "-", base_id).strip("-")
+        if name.isascii():
+            base_id = name.translate(_ASCII_ID_TABLE)
+        else:
+            base_id = _UNSAFE_ID_CHARS.sub("-", name.lower())
+        base_id = _DASH_RUNS.sub("-", base_id).strip("-")
 
         if not base_id:
             base_id = "config"
@@ -71,10 +141,15 @@ class ConfigManager:
         if not self._config_path(base_id).exists():
             return base_id
 
-        # Add suffix for uniqueness
+        # Add suffix for uniqueness, probing one directory snapshot rather
+        # than stat-ing each candidate (base_id only holds filename-safe chars).
+        # Names are compared casefolded so that on case-insensitive filesystems
+        # an existing Foo-1.json still blocks foo-1.
+        with os.scandir(self.config_dir) as entries:
+            taken = {entry.name[: -len(".json")].casefold() for entry in entries if entry.name.endswith(".json")}
         for i in range(1, 100):
             candidate = f"{base_id}-{i}"
-            if not self._config_path(candidate).exists():
+            if candidate.casefold() not in taken:
                 return candidate
 
         # Fallback to UUID
@@ -141,9 +216,7 @@ class ConfigManager:
             return None
 
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            return MountPlanConfig.from_dict(data)
+            return self._load_file(path)
         except Exception as e:
             logger.error(f"Failed to load config {config_id}: {e}")
             return None
@@ -203,6 +276,8 @@ class ConfigManager:
             return False
 
         path.unlink()
+        if self._drop_row(path.name):
+            self._write_index()
         logger.info(f"Deleted config: {config_id}")
         return True
 
@@ -213,16 +288,7 @@ class ConfigManager:
         Returns:
             List of all configs, sorted by updated_at descending
         """
-        configs = []
-        for path in self.config_dir.glob("*.json"):
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                configs.append(MountPlanConfig.from_dict(data))
-            except Exception as e:
-                logger.warning(f"Failed to load config {path.name}: {e}")
-
-        return sorted(configs, key=lambda c: c.updated_at, reverse=True)
+        return self._load_rows(self._refresh_index().items())
 
     def list_by_tag(self, tag: str) -> list[MountPlanConfig]:
         """
@@ -234,7 +300,8 @@ class ConfigManager:
         Returns:
             List of matching configs
         """
-        return [c for c in self.list_all() if tag in c.tags]
+        index = self._refresh_index()
+        return self._load_rows((name, index[name]) for name in self._tag_index.get(tag, ()))
 
     def list_configs(self, tags: list[str] | None = None) -> list[MountPlanConfig]:
         """
@@ -246,10 +313,157 @@ class ConfigManager:
         Returns:
             List of matching configs
         """
-        configs = self.list_all()
-        if tags:
-            configs = [c for c in configs if any(tag in c.tags for tag in tags)]
-        return configs
+        index = self._refresh_index()
+        if not tags:
+            return self._load_rows(index.items())
+        names = set().union(*(self._tag_index.get(tag, ()) for tag in tags))
+        return self._load_rows((name, index[name]) for name in names)
+
+    def _load_file(self, path: str | os.PathLike[str]) -> MountPlanConfig:
+        """Read and parse a config file."""
+        return MountPlanConfig.from_dict(json_utils.load_file(path))
+
+    def _try_load_file(self, filename: str, row: dict[str, Any]) -> MountPlanConfig | None:
+        """Load the config for an index row, logging and returning None on failure.
+
+        A config already parsed at the row's mtime/size is reused. Callers get
+        a shallow copy, so reassigning fields does not touch the cached one.
+        """
+        config = self._cached_parse(filename, row)
+        if config is None:
+            try:
+                config = self._load_file(self.config_dir / filename)
+            except Exception as e:
+                logger.warning(f"Failed to load config {filename}: {e}")
+                return None
+            self._parsed[filename] = (row["mtime_ns"], row["size"], config)
+        return copy.copy(config)
+
+    def _cached_parse(self, filename: str, row: dict[str, Any]) -> MountPlanConfig | None:
+        """The config parsed from filename at the row's mtime/size, if still cached."""
+        cached = self._parsed.get(filename)
+        if cached is None or cached[0] != row["mtime_ns"] or cached[1] != row["size"]:
+            return None
+        return cached[2]
+
+    def _load_rows(self, rows: Iterable[tuple[str, dict[str, Any]]]) -> list[MountPlanConfig]:
+        """Load the configs for index rows, most recently updated first.
+
+        Larger batches are read on a thread pool so file IO overlaps; parsing
+        itself still holds the GIL.
+        """
+        ordered = sorted(rows, key=lambda item: item[1]["updated_at"], reverse=True)
+        # Only files not parsed at their current mtime/size need any IO
+        pending = sum(1 for name, row in ordered if self._cached_parse(name, row) is None)
+        if pending < _PARALLEL_LOAD_MIN:
+            loaded = [self._try_load_file(name, row) for name, row in ordered]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, pending)) as executor:
+                loaded = list(executor.map(lambda item: self._try_load_file(*item), ordered))
+        return [config for config in loaded if config is not None]
+
+    # -------------------------------------------------------------------------
+    # Summary index
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _index_row(config: MountPlanConfig, st: os.stat_result) -> dict[str, Any]:
+        """Build the index row for a config file."""
+        return {
+            "id": config.id,
+            "name": config.name,
+            "updated_at": config.updated_at,
+            "tags": list(config.tags or []),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+
+    def _get_index(self) -> dict[str, dict[str, Any]]:
+        """Return the in-memory index, reading it from disk on first use."""
+        index = self._index
+        if index is None:
+            try:
+                data = json_utils.load_file(self._index_path)
+                index = dict(data["configs"])
+                self._tag_index = {tag: set(names) for tag, names in data["tags"].items()}
+            except FileNotFoundError:
+                index, self._tag_index = {}, {}
+            except Exception as e:
+                logger.warning(f"Rebuilding unreadable config index: {e}")
+                index, self._tag_index = {}, {}
+            self._index = index
+        return index
+
+    def _set_row(self, filename: str, row: dict[str, Any]) -> None:
+        """Insert or replace an index row, updating the tag posting lists."""
+        self._drop_row(filename)
+        self._get_index()[filename] = row
+        for tag in row["tags"]:
+            self._tag_index.setdefault(tag, set()).add(filename)
+
+    def _drop_row(self, filename: str) -> bool:
+        """Remove an index row, its tag postings and any cached parse. Returns True if the row existed."""
+        self._parsed.pop(filename, None)
+        row = self._get_index().pop(filename, None)
+        if row is None:
+            return False
+        for tag in row["tags"]:
+            names = self._tag_index.get(tag)
+            if names is not None:
+                names.discard(filename)
+                if not names:
+                    del self._tag_index[tag]
+        return True
+
+    def _write_index(self) -> None:
+        """Persist the in-memory index atomically."""
+        tags = {tag: sorted(names) for tag, names in self._tag_index.items()}
+        try:
+            # Not fsynced: a lost or stale index is reconciled from the config files
+            json_utils.dump_file(self._index_path, {"configs": self._index, "tags": tags}, durable=False)
+        except OSError as e:
+            logger.warning(f"Failed to write config index: {e}")
+
+    def _refresh_index(self) -> dict[str, dict[str, Any]]:
+        """Reconcile the index with the config directory.
+
+        One scandir pass; only files whose mtime or size changed (or that
+        are new) are parsed. Rows for removed files are dropped.
+
+        Returns:
+            Index rows keyed by config filename
+        """
+        index = self._get_index()
+        seen: set[str] = set()
+        changed = False
+
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json") or name == INDEX_FILENAME or not entry.is_file():
+                    continue
+                seen.add(name)
+                st = entry.stat()
+                row = index.get(name)
+                if row is not None and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+                    continue
+                try:
+                    config = self._load_file(entry.path)
+                    self._set_row(name, self._index_row(config, st))
+                    # Listing right after this reuses the parse instead of reading the file again
+                    self._parsed[name] = (st.st_mtime_ns, st.st_size, config)
+                except Exception as e:
+                    logger.warning(f"Failed to load config {name}: {e}")
+                    self._drop_row(name)
+                changed = True
+
+        for name in index.keys() - seen:
+            self._drop_row(name)
+            changed = True
+
+        if changed:
+            self._write_index()
+        return index
 
     # Aliases for consistent naming
     create_config = create
@@ -258,10 +472,13 @@ class ConfigManager:
     delete_config = delete
 
     def _save(self, config: MountPlanConfig) -> None:
-        """Save configuration to file."""
+        """Save configuration to file atomically and update its index row."""
         path = self._config_path(config.id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+        # Serialized straight from the fields; to_dict() would deep-copy the mount plan
+        json_utils.dump_file(path, config._field_values(), indent=True)
+
+        self._set_row(path.name, self._index_row(config, path.stat()))
+        self._write_index()
 
     def validate_mount_plan(self, mount_plan: dict[str, Any]) -> tuple[bool, list[str]]:
         """
@@ -273,33 +490,20 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-
-        # Check required fields
+        # Check required session fields
         session = mount_plan.get("session", {})
-        if not session.get("orchestrator"):
-            errors.append("Missing required field: session.orchestrator")
-        if not session.get("context"):
-            errors.append("Missing required field: session.context")
-
-        # Check providers
-        providers = mount_plan.get("providers", [])
-        if not providers:
-            errors.append("At least one provider is required")
-        else:
-            for i, provider in enumerate(providers):
-                if not provider.get("module"):
-                    errors.append(f"Provider {i}: missing 'module' field")
-
-        # Check tools (optional but validate structure if present)
-        for i, tool in enumerate(mount_plan.get("tools", [])):
-            if not tool.get("module"):
-                errors.append(f"Tool {i}: missing 'module' field")
-
-        # Check hooks (optional but validate structure if present)
-        for i, hook in enumerate(mount_plan.get("hooks", [])):
-            if not hook.get("module"):
-                errors.append(f"Hook {i}: missing 'module' field")
+        errors = [
+            f"Missing required field: session.{name}" for name in _REQUIRED_SESSION_FIELDS if not session.get(name)
+        ]
+
+        # Check module lists; each entry needs a 'module'
+        for section, label, required in _MODULE_SECTIONS:
+            entries = mount_plan.get(section) or []
+            if required and not entries:
+                errors.append(f"At least one {label.lower()} is required")
+            errors.extend(
+                f"{label} {i}: missing 'module' field" for i, entry in enumerate(entries) if not entry.get("module")
+            )
 
         return len(errors) == 0, errors
 
@@ -359,30 +563,18 @@ class ConfigManager:
         # Build YAML frontmatter from mount plan
         import yaml
 
-        frontmatter = {"profile": {"name": config.name}}
-
-        # Add session config
-        session = config.mount_plan.get("session", {})
-        if session:
-            frontmatter["session"] = session
-
-        # Add providers
-        providers = config.mount_plan.get("providers", [])
-        if providers:
-            frontmatter["providers"] = providers
-
-        # Add tools
-        tools = config.mount_plan.get("tools", [])
-        if tools:
-            frontmatter["tools"] = tools
+        frontmatter: dict[str, Any] = {"profile": {"name": config.name}}
 
-        # Add hooks
-        hooks = config.mount_plan.get("hooks", [])
-        if hooks:
-            frontmatter["hooks"] = hooks
+        # Add the non-empty session, provider, tool and hook sections
+        mount_plan = config.mount_plan
+        for section in ("session", "providers", "tools", "hooks"):
+            value = mount_plan.get(section)
+            if value:
+                frontmatter[section] = value
 
-        # Write profile
-        yaml_content = yaml.dump(frontmatter, default_flow_style=False)
+        # Write profile (libyaml's C emitter when PyYAML was built with it)
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        yaml_content = yaml.dump(frontmatter, Dumper=dumper, default_flow_style=False)
         desc = config.description or ""
         content = f"---\n{yaml_content}---\n\n# {config.name}\n\n{desc}\n"
 
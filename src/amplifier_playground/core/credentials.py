@@ -1,11 +1,14 @@
 """Credentials manager for storing API keys locally."""
 
-import json
+import copy
+import functools
 import os
 import stat
 from pathlib import Path
 from typing import Any
 
+from . import json_utils
+
 # Supported credential keys
 ANTHROPIC_API_KEY = "anthropic_api_key"
 OPENAI_API_KEY = "openai_api_key"
@@ -37,29 +40,51 @@ def _ensure_directory(path: Path) -> None:
     os.chmod(path.parent, stat.S_IRWXU)
 
 
+# Parsed credentials per file, tagged with the (st_mtime_ns, st_size) they were read at
+_credentials_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
 def _load_credentials() -> dict[str, Any]:
-    """Load credentials from file."""
+    """Load credentials from file.
+
+    The parsed file is cached until its mtime or size changes. Callers get a
+    copy they are free to mutate.
+    """
     path = get_credentials_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+
+    cached = _credentials_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+
     try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        credentials = json_utils.loads(path.read_bytes())
+    except (ValueError, IOError):
         return {}
 
+    _credentials_cache[path] = (st.st_mtime_ns, st.st_size, credentials)
+    return copy.deepcopy(credentials)
+
 
 def _save_credentials(credentials: dict[str, Any]) -> None:
     """Save credentials to file with secure permissions."""
     path = get_credentials_path()
     _ensure_directory(path)
 
-    with open(path, "w") as f:
-        json.dump(credentials, f, indent=2)
+    # Atomic replace of a file created owner-only, so the secrets are never
+    # readable by others, even briefly
+    json_utils.dump_file(path, credentials, indent=True, mode=stat.S_IRUSR | stat.S_IWUSR)
 
     # Set file permissions to 600 (owner read/write only)
     os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
 
+    # Prime the cache with what was just written so the next load skips the read
+    st = path.stat()
+    _credentials_cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(credentials))
+
 
 def get_credential(key: str) -> str | None:
     """
@@ -93,9 +118,12 @@ def set_credential(key: str, value: str) -> None:
         key: Credential key (e.g., 'anthropic_api_key')
         value: The credential value to store
     """
+    global _status_cache
+
     credentials = _load_credentials()
     credentials[key] = value
     _save_credentials(credentials)
+    _status_cache = None
 
     # Also set the environment variable immediately so it takes effect
     env_var = ENV_VAR_MAPPING.get(key)
@@ -113,10 +141,13 @@ def delete_credential(key: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
+    global _status_cache
+
     credentials = _load_credentials()
     if key in credentials:
         del credentials[key]
         _save_credentials(credentials)
+        _status_cache = None
 
         # Also remove from environment
         env_var = ENV_VAR_MAPPING.get(key)
@@ -127,6 +158,10 @@ def delete_credential(key: str) -> bool:
     return False
 
 
+# Last get_credential_status() result with the fingerprint it was computed for
+_status_cache: tuple[tuple[Any, ...], dict[str, dict[str, Any]]] | None = None
+
+
 def get_credential_status() -> dict[str, dict[str, Any]]:
     """
     Get status of all known credentials.
@@ -141,11 +176,24 @@ def get_credential_status() -> dict[str, dict[str, Any]]:
             }
         }
     """
+    global _status_cache
+
+    # Status depends only on the credentials file and the mapped env vars
+    path = get_credentials_path()
+    try:
+        st = path.stat()
+        file_state: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_state = None
+    fingerprint = (path, file_state, tuple(os.environ.get(env_var) for env_var in ENV_VAR_MAPPING.values()))
+    if _status_cache is not None and _status_cache[0] == fingerprint:
+        return copy.deepcopy(_status_cache[1])
+
     status = {}
+    stored_credentials = _load_credentials()
 
     for key, env_var in ENV_VAR_MAPPING.items():
         env_value = os.environ.get(env_var)
-        stored_credentials = _load_credentials()
         stored_value = stored_credentials.get(key)
 
         if env_value:
@@ -167,7 +215,8 @@ def get_credential_status() -> dict[str, dict[str, Any]]:
                 "masked_value": None,
             }
 
-    return status
+    _status_cache = (fingerprint, status)
+    return copy.deepcopy(status)
 
 
 def load_credentials_to_env() -> dict[str, str]:
@@ -234,6 +283,22 @@ CREDENTIAL_DISPLAY_NAMES = {
     VLLM_BASE_URL: "vLLM Base URL",
 }
 
+# Provider module name -> (credential_key, env_var, display_name) for each required
+# credential, resolved once from the tables above
+_PROVIDER_REQUIREMENTS: dict[str, tuple[tuple[str, str | None, str], ...]] = {
+    provider: tuple(
+        (key, ENV_VAR_MAPPING.get(key), CREDENTIAL_DISPLAY_NAMES.get(key, key)) for key in credential_keys
+    )
+    for provider, credential_keys in PROVIDER_CREDENTIAL_MAPPING.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _provider_module_name(module: str) -> str:
+    """Normalize a provider module reference (git URL, path or name) to its base name."""
+    return module.split("/")[-1].replace(".git", "")
+
+
 # Custom credentials key in the credentials file
 CUSTOM_CREDENTIALS_KEY = "_custom_credentials"
 
@@ -353,20 +418,18 @@ def get_required_credentials_for_providers(provider_modules: list[str]) -> list[
     status = get_credential_status()
 
     for module in provider_modules:
-        # Normalize module name (strip git URLs, get base name)
-        module_name = module.split("/")[-1].replace(".git", "")
+        module_name = _provider_module_name(module)
 
-        credential_keys = PROVIDER_CREDENTIAL_MAPPING.get(module_name, [])
-        for credential_key in credential_keys:
+        for credential_key, env_var, display_name in _PROVIDER_REQUIREMENTS.get(module_name, ()):
             if credential_key not in seen_keys:
                 seen_keys.add(credential_key)
                 cred_status = status.get(credential_key, {})
                 requirements.append({
                     "provider": module_name,
                     "credential_key": credential_key,
-                    "env_var": ENV_VAR_MAPPING.get(credential_key),
+                    "env_var": env_var,
                     "configured": cred_status.get("configured", False),
-                    "display_name": CREDENTIAL_DISPLAY_NAMES.get(credential_key, credential_key),
+                    "display_name": display_name,
                 })
 
     return requirements
@@ -0,0 +1,128 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup; without it these fall back to the stdlib json
+module and produce equivalent output.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped rather than read into a buffer
+# when orjson is available. Below it, mapping costs more than it saves.
+MMAP_THRESHOLD = 64 * 1024
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: JSON-compatible object.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        JSON document as a string.
+    """
+    return dumps_bytes(obj, indent=indent).decode()
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-compatible object.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        JSON document as UTF-8 bytes.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib's coercion of int/float/bool/None keys
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dump_file(path: Path, obj: Any, *, indent: bool = False, mode: int = 0o666, durable: bool = True) -> None:
+    """Write obj as JSON to path atomically.
+
+    The document goes to a temporary file in the same directory, which then
+    replaces path, so readers see either the old or the new file and never a
+    partial one.
+
+    Args:
+        path: Destination file.
+        obj: JSON-compatible object.
+        indent: Pretty-print with two-space indentation.
+        mode: Permission bits for the new file (subject to the umask).
+        durable: fsync the data before the rename so a crash cannot leave an
+            empty or truncated file. Skip for rebuildable caches.
+
+    Raises:
+        OSError: If the file cannot be written.
+        TypeError: If obj is not JSON serializable.
+    """
+    data = dumps_bytes(obj, indent=indent)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with open(fd, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str.
+
+    Returns:
+        Parsed object.
+
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError and
+            orjson.JSONDecodeError are both ValueError subclasses).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: str | os.PathLike[str]) -> Any:
+    """Read and parse a JSON file.
+
+    With orjson, large files are parsed straight from a read-only memory map
+    instead of being copied into a bytes object first. The stdlib parser
+    cannot take a buffer, so it always reads the file.
+
+    Args:
+        path: JSON file to read.
+
+    Returns:
+        Parsed object.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
@@ -10,27 +10,49 @@ MENTION_PATTERN: Pattern = re.compile(r"(?<![a-zA-Z0-9])@([a-zA-Z0-9_\-/\.:]+)")
 # @~/ pattern: matches @~/path/to/file
 HOME_PATTERN: Pattern = re.compile(r"@~/([a-zA-Z0-9_\-/\.]*)")
 
+# Both mention forms in one pattern, so parse_mentions walks the text once. The
+# alternatives cannot overlap ('~' and '@' are outside both path classes).
+_ANY_MENTION: Pattern = re.compile(
+    r"@~/(?P<home>[a-zA-Z0-9_\-/\.]*)"
+    r"|(?<![a-zA-Z0-9])@(?P<regular>[a-zA-Z0-9_\-/\.:]+)"
+)
+
+# Inline code, double-quoted and single-quoted spans (single line), removed before
+# extracting mentions so examples are not treated as real references. Applied in
+# this order, one pass each: stripping double quotes before single quotes keeps an
+# apostrophe inside "won't" from pairing with one in ordinary prose like "it's".
+_QUOTED_SPANS: tuple[Pattern, ...] = (
+    re.compile(r"`[^`\n]+`"),
+    re.compile(r'"[^"\n]*"'),
+    re.compile(r"'[^'\n]*'"),
+)
+
 
 def parse_mentions(text: str) -> list[str]:
-    """Extract all @mentions from text, excluding examples in code/quotes."""
-    # Filter out inline code and quotes
-    text_filtered = re.sub(r"`[^`\n]+`", "", text)
-    text_filtered = re.sub(r'"[^"\n]*"', "", text_filtered)
-    text_filtered = re.sub(r"'[^'\n]*'", "", text_filtered)
+    r"""Extract all @mentions from text, excluding examples in code/quotes.
 
-    # Extract home mentions
-    homes = [f"@~/{m}" if m else "@~/" for m in HOME_PATTERN.findall(text_filtered)]
+    >>> parse_mentions("See @foo and `@bar` or '@baz'")
+    ['@foo']
+    >>> parse_mentions("it's @foo and \"won't\"")
+    ['@foo']
+    >>> parse_mentions("\"don't\" miss @foo, it's real")
+    ['@foo']
+    """
+    # Filter out inline code, then double quotes, then single quotes
+    text_filtered = text
+    for pattern in _QUOTED_SPANS:
+        text_filtered = pattern.sub("", text_filtered)
 
-    # Regular mentions
-    all_at_mentions = MENTION_PATTERN.findall(text_filtered)
+    # Home mentions first, then regular ones, each in order of appearance
+    homes = []
     regulars = []
-    for m in all_at_mentions:
-        idx = text_filtered.find(f"@{m}")
-        if idx > 0:
-            before = text_filtered[max(0, idx - 2) : idx]
-            if before.endswith("~/"):
-                continue
-        if m == "mention":
+    for match in _ANY_MENTION.finditer(text_filtered):
+        home = match.group("home")
+        if home is not None:
+            homes.append(f"@~/{home}")
+            continue
+        m = match.group("regular")
+        if m == "mention" or text_filtered.endswith("~/", 0, match.start()):
             continue
         regulars.append(f"@{m}")
 
@@ -38,5 +60,8 @@ def parse_mentions(text: str) -> list[str]:
 
 
 def has_mentions(text: str) -> bool:
-    """Check if text contains any @mentions."""
-    return bool(MENTION_PATTERN.search(text))
+    """Check if text contains any @mentions, including @~/ home mentions.
+
+    A cheap substring check skips the regex search for text without an '@'.
+    """
+    return "@" in text and (MENTION_PATTERN.search(text) is not None or HOME_PATTERN.search(text) is not None)
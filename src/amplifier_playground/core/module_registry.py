@@ -1,18 +1,39 @@
 """Module registry for discovering and managing available modules."""
 
+import functools
 import logging
+import operator
+import os
+import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, get_args
 
 logger = logging.getLogger(__name__)
 
 ModuleType = Literal["provider", "tool", "orchestrator", "context", "hook"]
 
+# Valid categories, derived from ModuleType so the Literal stays the single source
+_VALID_CATEGORIES = frozenset(get_args(ModuleType))
+_VALID_CATEGORIES_STR = ", ".join(get_args(ModuleType))
 
-@dataclass
+# Seconds a discover_local() result is reused before entry points are rescanned
+DISCOVERY_TTL = 300.0
+
+# list_all() ordering
+_CATEGORY_ID_KEY = operator.attrgetter("category", "id")
+
+# Files marking a directory as an installable module
+_BUILD_FILES = frozenset({"pyproject.toml", "setup.py"})
+
+
+@dataclass(slots=True, frozen=True)
 class ModuleInfo:
-    """Information about an available module."""
+    """Information about an available module.
+
+    Immutable, so catalog entries can be shared between registries.
+    """
 
     id: str
     name: str
@@ -24,6 +45,187 @@ class ModuleInfo:
     config_schema: dict | None = None  # JSON Schema for config options (future)
     config: dict | None = None  # User-provided configuration for the module
 
+    def __post_init__(self):
+        """Intern category so category index lookups compare keys by identity."""
+        object.__setattr__(self, "category", sys.intern(self.category))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_loader_cls() -> Any:
+    """Import amplifier_core's ModuleLoader once; None if amplifier-core is not installed."""
+    try:
+        from amplifier_core.loader import ModuleLoader
+    except ImportError:
+        return None
+    return ModuleLoader
+
+
+# Curated catalog from MODULES.md - reference implementations. Built once at
+# import and shared by every registry.
+_KNOWN_MODULES: tuple[ModuleInfo, ...] = (
+    # === ORCHESTRATORS ===
+    ModuleInfo(
+        id="loop-basic",
+        name="Basic Loop Orchestrator",
+        category="orchestrator",
+        description="Standard sequential execution - simple request/response flow",
+        source="git+https://github.com/microsoft/amplifier-module-loop-basic@main",
+    ),
+    ModuleInfo(
+        id="loop-streaming",
+        name="Streaming Loop Orchestrator",
+        category="orchestrator",
+        description="Real-time streaming responses with extended thinking support",
+        source="git+https://github.com/microsoft/amplifier-module-loop-streaming@main",
+    ),
+    ModuleInfo(
+        id="loop-events",
+        name="Event-Driven Orchestrator",
+        category="orchestrator",
+        description="Event-driven orchestrator with hook integration",
+        source="git+https://github.com/microsoft/amplifier-module-loop-events@main",
+    ),
+    # === PROVIDERS ===
+    ModuleInfo(
+        id="provider-anthropic",
+        name="Anthropic Provider",
+        category="provider",
+        description="Anthropic Claude integration (Sonnet 4.5, Opus, etc.)",
+        source="git+https://github.com/microsoft/amplifier-module-provider-anthropic@main",
+    ),
+    ModuleInfo(
+        id="provider-openai",
+        name="OpenAI Provider",
+        category="provider",
+        description="OpenAI GPT integration",
+        source="git+https://github.com/microsoft/amplifier-module-provider-openai@main",
+    ),
+    ModuleInfo(
+        id="provider-azure-openai",
+        name="Azure OpenAI Provider",
+        category="provider",
+        description="Azure OpenAI with managed identity support",
+        source="git+https://github.com/microsoft/amplifier-module-provider-azure-openai@main",
+    ),
+    ModuleInfo(
+        id="provider-ollama",
+        name="Ollama Provider",
+        category="provider",
+        description="Local Ollama models",
+        source="git+https://github.com/microsoft/amplifier-module-provider-ollama@main",
+    ),
+    ModuleInfo(
+        id="provider-mock",
+        name="Mock Provider",
+        category="provider",
+        description="Mock provider for testing",
+        source="git+https://github.com/microsoft/amplifier-module-provider-mock@main",
+    ),
+    # === TOOLS ===
+    ModuleInfo(
+        id="tool-filesystem",
+        name="Filesystem Tool",
+        category="tool",
+        description="File operations (read, write, edit, list)",
+        source="git+https://github.com/microsoft/amplifier-module-tool-filesystem@main",
+    ),
+    ModuleInfo(
+        id="tool-bash",
+        name="Bash Tool",
+        category="tool",
+        description="Shell command execution",
+        source="git+https://github.com/microsoft/amplifier-module-tool-bash@main",
+    ),
+    ModuleInfo(
+        id="tool-web",
+        name="Web Tool",
+        category="tool",
+        description="Web search and content fetching",
+        source="git+https://github.com/microsoft/amplifier-module-tool-web@main",
+    ),
+    ModuleInfo(
+        id="tool-search",
+        name="Search Tool",
+        category="tool",
+        description="Web search capabilities",
+        source="git+https://github.com/microsoft/amplifier-module-tool-search@main",
+    ),
+    ModuleInfo(
+        id="tool-task",
+        name="Task Tool",
+        category="tool",
+        description="Agent delegation (sub-session spawning)",
+        source="git+https://github.com/microsoft/amplifier-module-tool-task@main",
+    ),
+    # === CONTEXT MANAGERS ===
+    ModuleInfo(
+        id="context-simple",
+        name="Simple Context Manager",
+        category="context",
+        description="In-memory context with automatic compaction",
+        source="git+https://github.com/microsoft/amplifier-module-context-simple@main",
+    ),
+    ModuleInfo(
+        id="context-persistent",
+        name="Persistent Context Manager",
+        category="context",
+        description="File-backed persistent context across sessions",
+        source="git+https://github.com/microsoft/amplifier-module-context-persistent@main",
+    ),
+    # === HOOKS ===
+    ModuleInfo(
+        id="hooks-logging",
+        name="Logging Hooks",
+        category="hook",
+        description="Unified JSONL event logging to per-session files",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-logging@main",
+    ),
+    ModuleInfo(
+        id="hooks-redaction",
+        name="Redaction Hooks",
+        category="hook",
+        description="Privacy-preserving data redaction",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-redaction@main",
+    ),
+    ModuleInfo(
+        id="hooks-approval",
+        name="Approval Hooks",
+        category="hook",
+        description="Interactive approval for sensitive operations",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-approval@main",
+    ),
+    ModuleInfo(
+        id="hooks-backup",
+        name="Backup Hooks",
+        category="hook",
+        description="Automatic session backup",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-backup@main",
+    ),
+    ModuleInfo(
+        id="hooks-streaming-ui",
+        name="Streaming UI Hooks",
+        category="hook",
+        description="Real-time UI updates during streaming",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-streaming-ui@main",
+    ),
+    ModuleInfo(
+        id="hooks-scheduler-cost-aware",
+        name="Cost-Aware Scheduler",
+        category="hook",
+        description="Cost-aware model routing",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-scheduler-cost-aware@main",
+    ),
+    ModuleInfo(
+        id="hooks-scheduler-heuristic",
+        name="Heuristic Scheduler",
+        category="hook",
+        description="Heuristic-based model selection",
+        source="git+https://github.com/microsoft/amplifier-module-hooks-scheduler-heuristic@main",
+    ),
+)
+_KNOWN_MODULES_BY_ID: dict[str, ModuleInfo] = {m.id: m for m in _KNOWN_MODULES}
+_KNOWN_MODULES_SORTED: tuple[ModuleInfo, ...] = tuple(sorted(_KNOWN_MODULES, key=_CATEGORY_ID_KEY))
+
 
 @dataclass
 class ModuleRegistry:
@@ -39,193 +241,76 @@ class ModuleRegistry:
     _discovered: dict[str, ModuleInfo] = field(default_factory=dict)
     _known: dict[str, ModuleInfo] = field(default_factory=dict)
     _local: dict[str, ModuleInfo] = field(default_factory=dict)
+    # Category -> module ID -> effective (highest-precedence) ModuleInfo
+    _by_category: dict[str, dict[str, ModuleInfo]] = field(default_factory=dict)
+    # Bumped on every tier write; list_all() reuses its last result while unchanged
+    _version: int = 0
+    _list_cache: tuple[int, tuple[ModuleInfo, ...]] | None = None
+    # time.monotonic() of the last successful discovery, None if never run
+    _discovered_at: float | None = None
+    # Known tier in list_all() order, precomputed since it never changes
+    _known_sorted: tuple[ModuleInfo, ...] = ()
 
     def __post_init__(self):
         """Initialize with known modules."""
         self._init_known_modules()
+        for module_id in {**self._known, **self._discovered, **self._local}:
+            self._reindex(module_id, None)
 
     def _init_known_modules(self):
         """Initialize curated list of known modules from the Amplifier module catalog."""
-        # All modules from MODULES.md - reference implementations
-        known = [
-            # === ORCHESTRATORS ===
-            ModuleInfo(
-                id="loop-basic",
-                name="Basic Loop Orchestrator",
-                category="orchestrator",
-                description="Standard sequential execution - simple request/response flow",
-                source="git+https://github.com/microsoft/amplifier-module-loop-basic@main",
-            ),
-            ModuleInfo(
-                id="loop-streaming",
-                name="Streaming Loop Orchestrator",
-                category="orchestrator",
-                description="Real-time streaming responses with extended thinking support",
-                source="git+https://github.com/microsoft/amplifier-module-loop-streaming@main",
-            ),
-            ModuleInfo(
-                id="loop-events",
-                name="Event-Driven Orchestrator",
-                category="orchestrator",
-                description="Event-driven orchestrator with hook integration",
-                source="git+https://github.com/microsoft/amplifier-module-loop-events@main",
-            ),
-            # === PROVIDERS ===
-            ModuleInfo(
-                id="provider-anthropic",
-                name="Anthropic Provider",
-                category="provider",
-                description="Anthropic Claude integration (Sonnet 4.5, Opus, etc.)",
-                source="git+https://github.com/microsoft/amplifier-module-provider-anthropic@main",
-            ),
-            ModuleInfo(
-                id="provider-openai",
-                name="OpenAI Provider",
-                category="provider",
-                description="OpenAI GPT integration",
-                source="git+https://github.com/microsoft/amplifier-module-provider-openai@main",
-            ),
-            ModuleInfo(
-                id="provider-azure-openai",
-                name="Azure OpenAI Provider",
-                category="provider",
-                description="Azure OpenAI with managed identity support",
-                source="git+https://github.com/microsoft/amplifier-module-provider-azure-openai@main",
-            ),
-            ModuleInfo(
-                id="provider-ollama",
-                name="Ollama Provider",
-                category="provider",
-                description="Local Ollama models",
-                source="git+https://github.com/microsoft/amplifier-module-provider-ollama@main",
-            ),
-            ModuleInfo(
-                id="provider-mock",
-                name="Mock Provider",
-                category="provider",
-                description="Mock provider for testing",
-                source="git+https://github.com/microsoft/amplifier-module-provider-mock@main",
-            ),
-            # === TOOLS ===
-            ModuleInfo(
-                id="tool-filesystem",
-                name="Filesystem Tool",
-                category="tool",
-                description="File operations (read, write, edit, list)",
-                source="git+https://github.com/microsoft/amplifier-module-tool-filesystem@main",
-            ),
-            ModuleInfo(
-                id="tool-bash",
-                name="Bash Tool",
-                category="tool",
-                description="Shell command execution",
-                source="git+https://github.com/microsoft/amplifier-module-tool-bash@main",
-            ),
-            ModuleInfo(
-                id="tool-web",
-                name="Web Tool",
-                category="tool",
-                description="Web search and content fetching",
-                source="git+https://github.com/microsoft/amplifier-module-tool-web@main",
-            ),
-            ModuleInfo(
-                id="tool-search",
-                name="Search Tool",
-                category="tool",
-                description="Web search capabilities",
-                source="git+https://github.com/microsoft/amplifier-module-tool-search@main",
-            ),
-            ModuleInfo(
-                id="tool-task",
-                name="Task Tool",
-                category="tool",
-                description="Agent delegation (sub-session spawning)",
-                source="git+https://github.com/microsoft/amplifier-module-tool-task@main",
-            ),
-            # === CONTEXT MANAGERS ===
-            ModuleInfo(
-                id="context-simple",
-                name="Simple Context Manager",
-                category="context",
-                description="In-memory context with automatic compaction",
-                source="git+https://github.com/microsoft/amplifier-module-context-simple@main",
-            ),
-            ModuleInfo(
-                id="context-persistent",
-                name="Persistent Context Manager",
-                category="context",
-                description="File-backed persistent context across sessions",
-                source="git+https://github.com/microsoft/amplifier-module-context-persistent@main",
-            ),
-            # === HOOKS ===
-            ModuleInfo(
-                id="hooks-logging",
-                name="Logging Hooks",
-                category="hook",
-                description="Unified JSONL event logging to per-session files",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-logging@main",
-            ),
-            ModuleInfo(
-                id="hooks-redaction",
-                name="Redaction Hooks",
-                category="hook",
-                description="Privacy-preserving data redaction",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-redaction@main",
-            ),
-            ModuleInfo(
-                id="hooks-approval",
-                name="Approval Hooks",
-                category="hook",
-                description="Interactive approval for sensitive operations",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-approval@main",
-            ),
-            ModuleInfo(
-                id="hooks-backup",
-                name="Backup Hooks",
-                category="hook",
-                description="Automatic session backup",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-backup@main",
-            ),
-            ModuleInfo(
-                id="hooks-streaming-ui",
-                name="Streaming UI Hooks",
-                category="hook",
-                description="Real-time UI updates during streaming",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-streaming-ui@main",
-            ),
-            ModuleInfo(
-                id="hooks-scheduler-cost-aware",
-                name="Cost-Aware Scheduler",
-                category="hook",
-                description="Cost-aware model routing",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-scheduler-cost-aware@main",
-            ),
-            ModuleInfo(
-                id="hooks-scheduler-heuristic",
-                name="Heuristic Scheduler",
-                category="hook",
-                description="Heuristic-based model selection",
-                source="git+https://github.com/microsoft/amplifier-module-hooks-scheduler-heuristic@main",
-            ),
-        ]
-
-        for module in known:
-            self._known[module.id] = module
-
-    async def discover_local(self) -> list[ModuleInfo]:
+        self._known.update(_KNOWN_MODULES_BY_ID)
+        if len(self._known) == len(_KNOWN_MODULES_BY_ID):
+            self._known_sorted = _KNOWN_MODULES_SORTED
+        else:
+            # Extra entries were passed in; sort this registry's own known tier
+            self._known_sorted = tuple(sorted(self._known.values(), key=_CATEGORY_ID_KEY))
+
+    def _reindex(self, module_id: str, previous: ModuleInfo | None) -> None:
+        """Update the category index after a tier changed for module_id.
+
+        Args:
+            module_id: Module whose entry was added, replaced or removed
+            previous: Effective ModuleInfo for module_id before the change
+        """
+        self._version += 1
+        if previous is not None:
+            self._by_category.get(previous.category, {}).pop(module_id, None)
+        current = self.get_info(module_id)
+        if current is not None:
+            self._by_category.setdefault(current.category, {})[module_id] = current
+
+    async def discover_local(self, refresh: bool = False) -> list[ModuleInfo]:
         """
         Discover installed modules using ModuleLoader.
 
+        Discovery runs on demand, never at construction. Its result is reused
+        for DISCOVERY_TTL seconds so repeated calls don't rescan entry points.
+
+        Args:
+            refresh: Rescan even if a recent result is available
+
         Returns:
             List of discovered ModuleInfo
         """
-        try:
-            from amplifier_core.loader import ModuleLoader
+        if (
+            not refresh
+            and self._discovered_at is not None
+            and time.monotonic() - self._discovered_at < DISCOVERY_TTL
+        ):
+            return list(self._discovered.values())
 
-            loader = ModuleLoader()
+        loader_cls = _get_loader_cls()
+        if loader_cls is None:
+            logger.warning("amplifier-core not installed, skipping module discovery")
+            return []
+
+        try:
+            loader = loader_cls()
             discovered = await loader.discover()
 
             for info in discovered:
+                previous = self.get_info(info.id)
                 module_info = ModuleInfo(
                     id=info.id,
                     name=info.name,
@@ -236,13 +321,12 @@ class ModuleRegistry:
                     installed=True,
                 )
                 self._discovered[info.id] = module_info
+                self._reindex(info.id, previous)
 
+            self._discovered_at = time.monotonic()
             logger.info(f"Discovered {len(discovered)} installed modules")
             return list(self._discovered.values())
 
-        except ImportError:
-            logger.warning("amplifier-core not installed, skipping module discovery")
-            return []
         except Exception as e:
             logger.error(f"Module discovery failed: {e}")
             return []
@@ -271,11 +355,15 @@ class ModuleRegistry:
         Raises:
             ValueError: If path doesn't exist or is invalid
         """
-        if not path.exists():
-            raise ValueError(f"Module path does not exist: {path}")
-
-        # Check for valid module structure
-        if not (path / "pyproject.toml").exists() and not (path / "setup.py").exists():
+        # Check for valid module structure with a single directory read
+        try:
+            with os.scandir(path) as entries:
+                has_build_file = any(entry.name in _BUILD_FILES for entry in entries)
+        except FileNotFoundError:
+            raise ValueError(f"Module path does not exist: {path}") from None
+        except NotADirectoryError:
+            has_build_file = False
+        if not has_build_file:
             raise ValueError(f"Invalid module structure at {path}: missing pyproject.toml or setup.py")
 
         module_info = ModuleInfo(
@@ -287,7 +375,9 @@ class ModuleRegistry:
             installed=False,
         )
 
+        previous = self.get_info(module_id)
         self._local[module_id] = module_info
+        self._reindex(module_id, previous)
         logger.info(f"Registered local module: {module_id} at {path}")
         return module_info
 
@@ -302,7 +392,8 @@ class ModuleRegistry:
             True if unregistered, False if not found
         """
         if module_id in self._local:
-            del self._local[module_id]
+            previous = self._local.pop(module_id)
+            self._reindex(module_id, previous)
             logger.info(f"Unregistered local module: {module_id}")
             return True
         return False
@@ -336,9 +427,8 @@ class ModuleRegistry:
         Raises:
             ValueError: If category is invalid
         """
-        valid_categories = ["provider", "tool", "orchestrator", "context", "hook"]
-        if category not in valid_categories:
-            raise ValueError(f"Invalid category '{category}'. Must be one of: {', '.join(valid_categories)}")
+        if category not in _VALID_CATEGORIES:
+            raise ValueError(f"Invalid category '{category}'. Must be one of: {_VALID_CATEGORIES_STR}")
 
         module_info = ModuleInfo(
             id=module_id,
@@ -350,7 +440,9 @@ class ModuleRegistry:
             config=config,
         )
 
+        previous = self.get_info(module_id)
         self._local[module_id] = module_info
+        self._reindex(module_id, previous)
         logger.info(f"Added custom module: {module_id} ({category}) from {source}")
         return module_info
 
@@ -364,8 +456,7 @@ class ModuleRegistry:
         Returns:
             List of matching modules
         """
-        all_modules = self.list_all()
-        return [m for m in all_modules if m.category == category]
+        return sorted(self._by_category.get(sys.intern(category), {}).values(), key=lambda m: m.id)
 
     def list_all(self) -> list[ModuleInfo]:
         """
@@ -373,21 +464,18 @@ class ModuleRegistry:
 
         Precedence: local > discovered > known
         """
-        result: dict[str, ModuleInfo] = {}
-
-        # Add known first (lowest precedence)
-        for module_id, info in self._known.items():
-            result[module_id] = info
-
-        # Override with discovered (higher precedence)
-        for module_id, info in self._discovered.items():
-            result[module_id] = info
-
-        # Override with local (highest precedence)
-        for module_id, info in self._local.items():
-            result[module_id] = info
-
-        return sorted(result.values(), key=lambda m: (m.category, m.id))
+        if self._list_cache is not None and self._list_cache[0] == self._version:
+            return list(self._list_cache[1])
+
+        if not self._discovered and not self._local:
+            # Common case when browsing the catalog: nothing to merge or sort
+            modules = self._known_sorted
+        else:
+            # Later tiers override earlier ones: known < discovered < local
+            merged = {**self._known, **self._discovered, **self._local}
+            modules = tuple(sorted(merged.values(), key=_CATEGORY_ID_KEY))
+        self._list_cache = (self._version, modules)
+        return list(modules)
 
     def get_info(self, module_id: str) -> ModuleInfo | None:
         """
@@ -399,14 +487,8 @@ class ModuleRegistry:
         Returns:
             ModuleInfo if found, None otherwise
         """
-        # Check in order of precedence
-        if module_id in self._local:
-            return self._local[module_id]
-        if module_id in self._discovered:
-            return self._discovered[module_id]
-        if module_id in self._known:
-            return self._known[module_id]
-        return None
+        # Check in order of precedence; ModuleInfo instances are always truthy
+        return self._local.get(module_id) or self._discovered.get(module_id) or self._known.get(module_id)
 
     # Alias for backwards compatibility
     get = get_info
@@ -0,0 +1,176 @@
+"""On-disk cache of compiled mount plans.
+
+Compiling a profile resolves inheritance, agents and @mentions across every
+collection, which is wasted work when nothing on disk has changed. Entries are
+keyed by a fingerprint of the profile reference, the installed versions of the
+packages involved in compiling and the (path, mtime, size) of every file under
+the given source directories, so any edit, addition or removal of a file there
+(or a package upgrade) produces a new key. Files outside those directories are
+not tracked, so the cache is opt-in (`amplay session run --cache`). Writing an entry removes older entries for
+the same profile, so the cache holds one plan per profile.
+"""
+
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+from collections.abc import Iterable
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from . import json_utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".amplifier-playground" / "cache" / "mount-plans"
+
+# Directories that never hold profile sources (hidden directories are skipped too)
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+# Packages whose code shapes a compiled plan: the profile compiler, collection
+# resolution, and this package's agent/@mention loading
+_VERSIONED_PACKAGES = ("amplifier-profiles", "amplifier-collections", "amplifier-playground")
+
+
+@functools.lru_cache(maxsize=1)
+def _package_versions() -> str:
+    """Installed versions of _VERSIONED_PACKAGES, joined into one string."""
+    versions = []
+    for package in _VERSIONED_PACKAGES:
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=unknown")
+    return ",".join(versions)
+
+
+def _iter_file_stats(root: Path) -> Iterable[tuple[str, int, int]]:
+    """Yield (path, mtime_ns, size) for every file below root.
+
+    Hidden directories and bytecode caches are skipped. A missing root yields
+    nothing, so it fingerprints the same as an empty one.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.name.startswith(".") and entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        yield entry.path, st.st_mtime_ns, st.st_size
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+
+def fingerprint(profile: str, source_dirs: Iterable[Path]) -> str:
+    """Compute the cache key for a profile compiled from the given sources.
+
+    Only file metadata is read, so computing the key costs one stat per file.
+
+    Args:
+        profile: Profile reference (collection:profile or local profile name)
+        source_dirs: Directories whose contents can affect the compiled plan
+            (collection search paths, local profile/agent/context directories)
+
+    Returns:
+        Key of the form "<profile digest>-<source digest>". The prefix is the
+        same for every state of one profile, which lets put() prune older
+        entries for it.
+    """
+    profile_digest = hashlib.blake2b(profile.encode(), digest_size=8).hexdigest()
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{profile}\0{_package_versions()}\0".encode())
+    for root in source_dirs:
+        digest.update(f"{root}\0".encode())
+        for path, mtime_ns, size in sorted(_iter_file_stats(root)):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\0".encode())
+    return f"{profile_digest}-{digest.hexdigest()}"
+
+
+class MountPlanCache:
+    """Stores compiled mount plans as JSON files keyed by fingerprint()."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries. Defaults to
+                      ~/.amplifier-playground/cache/mount-plans/
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        """Load a cached compile result.
+
+        Args:
+            key: Fingerprint of the profile and its sources
+
+        Returns:
+            Tuple of (profile display name, mount plan), or None on a miss or
+            an unreadable entry.
+        """
+        try:
+            data = json_utils.loads(self._entry_path(key).read_bytes())
+            return data["profile_name"], data["mount_plan"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable mount plan cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, profile_name: str, mount_plan: dict[str, Any]) -> None:
+        """Store a compile result and drop older entries for the same profile.
+
+        Failures are logged and otherwise ignored; the cache is only an
+        optimization.
+
+        Args:
+            key: Fingerprint of the profile and its sources
+            profile_name: Profile display name
+            mount_plan: Compiled mount plan
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Atomic so concurrent readers never see a partial entry
+            json_utils.dump_file(
+                self._entry_path(key), {"profile_name": profile_name, "mount_plan": mount_plan}, durable=False
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache mount plan for '{profile_name}': {e}")
+            return
+        self._prune(key)
+
+    def _prune(self, key: str) -> None:
+        """Remove entries for the same profile as key, other than key itself.
+
+        Entries without a profile prefix (written before keys had one) are
+        removed too, since nothing can look them up any more.
+        """
+        prefix = key.partition("-")[0] + "-"
+        keep = f"{key}.json"
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                stale = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and entry.name != keep
+                    and (entry.name.startswith(prefix) or "-" not in entry.name)
+                ]
+            for path in stale:
+                # Another process may be pruning the same entries
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to prune mount plan cache: {e}")
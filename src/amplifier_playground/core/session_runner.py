@@ -52,6 +52,7 @@ class SessionRunner:
         session_id: str | None = None,
         modules_dirs: list[Path | str] | Path | str | None = None,
         profile_name: str | None = None,
+        collection_manager: CollectionManager | None = None,
     ):
         """
         Initialize session runner.
@@ -65,12 +66,16 @@ class SessionRunner:
                          Modules should be in subdirectories like amplifier-module-provider-anthropic/
                          Directories are searched in order (first match wins).
             profile_name: Optional profile name for loading system context (e.g., "foundation:base")
+            collection_manager: Collection manager for resolving the profile and its @mentions.
+                               Pass a long-lived one to reuse its discovery caches; a new
+                               manager is created on demand if omitted.
         """
         self.mount_plan = mount_plan
         self.event_callback = event_callback
         self.approval_mode: Literal["auto", "deny", "queue"] = approval_mode
         self.session_id = session_id or str(uuid.uuid4())
         self.profile_name = profile_name
+        self.collection_manager = collection_manager
 
         # Normalize modules_dirs to a list of Paths
         if modules_dirs is None:
@@ -321,7 +326,7 @@ class SessionRunner:
             # Create profile loader to find the profile file
             from amplifier_profiles import ProfileLoader
 
-            coll_manager = CollectionManager()
+            coll_manager = self.collection_manager or CollectionManager()
             resolver = CollectionResolverAdapter(coll_manager)
 
             # Build search paths
@@ -425,6 +430,7 @@ class SessionManager:
         session_id: str | None = None,
         modules_dirs: list[Path | str] | Path | str | None = None,
         profile_name: str | None = None,
+        collection_manager: CollectionManager | None = None,
     ) -> SessionRunner:
         """
         Create and start a new session.
@@ -436,6 +442,7 @@ class SessionManager:
             session_id: Optional explicit session ID
             modules_dirs: Directory or list of directories containing amplifier modules
             profile_name: Optional profile name for loading system context
+            collection_manager: Optional shared collection manager for the session
 
         Returns:
             Started SessionRunner
@@ -447,6 +454,7 @@ class SessionManager:
             session_id=session_id,
             modules_dirs=modules_dirs,
             profile_name=profile_name,
+            collection_manager=collection_manager,
         )
 
         await runner.start()
@@ -24,6 +24,8 @@ def get_manager() -> CollectionManager:
 async def list_collections() -> list[CollectionInfo]:
     """List available collections."""
     manager = get_manager()
+    # Pick up collection changes on disk since the last listing
+    manager.refresh()
     collections = manager.list_collections()
 
     return [CollectionInfo(name=c.name, path=str(c.path)) for c in collections]
@@ -110,6 +110,8 @@ def build_agent_loader(coll_manager: CollectionManager) -> AgentLoader:
 async def list_profiles() -> list[ProfileListItem]:
     """List all available profiles from collections and local directories."""
     manager = get_collection_manager()
+    # Pick up profiles added on disk since the last listing
+    manager.refresh()
     all_profiles: list[ProfileListItem] = []
 
     # Get profiles from each collection
@@ -210,6 +210,7 @@ async def create_session(request: CreateSessionRequest) -> SessionInfo:
         approval_mode=request.approval_mode,  # type: ignore
         modules_dirs=request.modules_dirs,
         profile_name=profile_name,
+        collection_manager=collection_manager,
     )
     session_id = runner.session_id
 